@@ -16,10 +16,11 @@ Usage::
     python .reuse/add_license.py <shortcut> <path> [OPTIONS]
 """
 
+import os
 import os.path as osp
 from argparse import ArgumentParser
 from textwrap import dedent
-from typing import Dict, Optional, TypedDict
+from typing import Dict, Optional, Tuple, TypedDict
 
 import yaml
 from reuse.project import Project
@@ -33,6 +34,11 @@ except ImportError:
     from reuse.header import add_arguments as _orig_add_arguments
     from reuse.header import run
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore
+
 
 class LicenseShortCut(TypedDict):
     """Shortcut to add a copyright statement"""
@@ -47,11 +53,28 @@ class LicenseShortCut(TypedDict):
     license: Optional[str]
 
 
-def load_shortcuts() -> Dict[str, LicenseShortCut]:
-    """Load the ``shortcuts.yaml`` file."""
+#: Parsed shortcut files. Maps the path of the file to its modification time,
+#: its size and the parsed content
+_shortcuts_cache: Dict[
+    str, Tuple[float, int, Dict[str, LicenseShortCut]]
+] = {}
 
-    with open(osp.join(osp.dirname(__file__), "shortcuts.yaml")) as f:
-        return yaml.safe_load(f)
+
+def load_shortcuts() -> Dict[str, LicenseShortCut]:
+    """Load the ``shortcuts.yaml`` file.
+
+    The parsed file is cached and only read again if its modification time
+    or its size changed."""
+    path = osp.join(osp.dirname(__file__), "shortcuts.yaml")
+    st = os.stat(path)
+    cached = _shortcuts_cache.get(path)
+    if cached is not None and cached[:2] == (st.st_mtime, st.st_size):
+        return cached[2]
+    # read the file at once in binary mode and let libyaml do the decoding
+    with open(path, "rb") as f:
+        shortcuts = yaml.load(f.read(), Loader=_YamlLoader)
+    _shortcuts_cache[path] = (st.st_mtime, st.st_size, shortcuts)
+    return shortcuts
 
 
 def add_arguments(
@@ -72,9 +95,20 @@ def add_arguments(
     parser.set_defaults(parser=parser)
 
 
-def main(argv=None):
-    shortcuts = load_shortcuts()
+#: The shortcuts of the last :func:`get_parser` call and the corresponding
+#: parser
+_parser_cache: Optional[
+    Tuple[Dict[str, LicenseShortCut], ArgumentParser]
+] = None
 
+
+def get_parser(shortcuts: Dict[str, LicenseShortCut]) -> ArgumentParser:
+    """Get the parser for the command line.
+
+    The parser is only created once for the given `shortcuts`."""
+    global _parser_cache
+    if _parser_cache is not None and _parser_cache[0] is shortcuts:
+        return _parser_cache[1]
     parser = ArgumentParser(
         prog=".reuse/add_license.py",
         description=dedent(
@@ -93,22 +127,24 @@ def main(argv=None):
         ),
     )
     add_arguments(parser, shortcuts)
+    _parser_cache = (shortcuts, parser)
+    return parser
+
+
+def main(argv=None):
+    shortcuts = load_shortcuts()
+
+    parser = get_parser(shortcuts)
 
     args = parser.parse_args(argv)
 
     shortcut = shortcuts[args.shortcut]
 
-    if args.year is None:
-        args.year = []
-    if args.copyright is None:
-        args.copyright = []
-
-    if args.license is None and shortcut.get("license"):
-        args.license = [shortcut["license"]]
-    elif args.license and shortcut.get("license"):
-        args.license.append(shortcut["license"])
-    args.year.append(shortcut["year"])
-    args.copyright.append(shortcut["copyright"])
+    license = shortcut.get("license")
+    if license:
+        args.license = (args.license or []) + [license]
+    args.year = (args.year or []) + [shortcut["year"]]
+    args.copyright = (args.copyright or []) + [shortcut["copyright"]]
 
     project = Project(find_root())
     args.func(args, project)
@@ -14,10 +14,11 @@
 # add these directories to sys.path here. If the directory is relative to the
 # documentation root, use os.path.abspath to make it absolute, like shown here.
 #
+import hashlib
 import os
+import re
 import sys
 import warnings
-from itertools import product
 from pathlib import Path
 
 from sphinx.ext import apidoc
@@ -60,17 +61,31 @@ warnings.filterwarnings(
 )
 
 
+def _source_digest(appdir):
+    """Get a digest of the paths, mtimes and sizes of the python files"""
+    h = hashlib.blake2b()
+    for p in sorted(appdir.rglob("*.py")):
+        s = p.stat()
+        h.update(f"{p}{s.st_mtime_ns}{s.st_size}".encode())
+    return h.hexdigest()
+
+
 def generate_apidoc(app):
     appdir = Path(app.__file__).parent
+    # only regenerate the API docs if the sources changed since the last run
+    stamp = api / ".stamp"
+    digest = _source_digest(appdir)
+    if stamp.exists() and stamp.read_text() == digest:
+        return
     apidoc.main(
         ["-fMEeTo", str(api), str(appdir), str(appdir / "migrations" / "*")]
     )
+    stamp.write_text(digest)
 
 
 api = Path("api")
 
-if not api.exists():
-    generate_apidoc(psyplot)
+generate_apidoc(psyplot)
 
 # -- Project information -----------------------------------------------------
 
@@ -197,6 +212,23 @@ intersphinx_mapping = {
     "python": ("https://docs.python.org/3/", None),
 }
 
+
+def _local_inventory(name, url, inventory):
+    """Prefer a local copy of an inventory in ``_intersphinx`` if present"""
+    local = Path("_intersphinx") / (name + ".inv")
+    if local.exists():
+        return url, (str(local), inventory)
+    return url, inventory
+
+
+intersphinx_mapping = {
+    name: _local_inventory(name, *val)
+    for name, val in intersphinx_mapping.items()
+}
+
+# keep downloaded inventories for 90 days (in days, default: 5)
+intersphinx_cache_limit = 90
+
 replacements = {
     "`psyplot.rcParams`": "`~psyplot.config.rcsetup.rcParams`",
     "`psyplot.InteractiveList`": "`~psyplot.data.InteractiveList`",
@@ -206,11 +238,15 @@ replacements = {
 }
 
 
+_alias_patt = re.compile("|".join(map(re.escape, replacements)))
+
+
 def link_aliases(app, what, name, obj, options, lines):
-    for (key, val), (i, line) in product(
-        replacements.items(), enumerate(lines)
-    ):
-        lines[i] = line.replace(key, val)
+    for i, line in enumerate(lines):
+        if "`psyplot." in line:
+            lines[i] = _alias_patt.sub(
+                lambda m: replacements[m.group(0)], line
+            )
 
 
 fmt_attrs_map = {
@@ -267,12 +303,15 @@ fmt_attrs_map = {
 }
 
 
+#: mapping from attribute name to its group in :data:`fmt_attrs_map`
+fmt_attrs_groups = {
+    attr: group for group, attrs in fmt_attrs_map.items() for attr in attrs
+}
+
+
 def group_fmt_attributes(app, what, name, obj, section, parent):
     if parent is Formatoption:
-        return next(
-            (group for group, val in fmt_attrs_map.items() if name in val),
-            None,
-        )
+        return fmt_attrs_groups.get(name)
 
 
 def setup(app):
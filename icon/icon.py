@@ -10,6 +10,10 @@ of 8 inches. The file is saved it to ``'icon1024.pkl'``"""
 #
 # SPDX-License-Identifier: LGPL-3.0-only
 
+import os
+from functools import lru_cache
+
+import cartopy
 import cartopy.crs as ccrs
 import cartopy.feature as cf
 import matplotlib.pyplot as plt
@@ -18,6 +22,19 @@ from matplotlib.text import FontProperties
 # The path to the font
 fontpath = "/Library/Fonts/FreeSansBoldOblique.ttf"
 
+# use a pre-populated directory with the Natural Earth shapefiles, if given,
+# to avoid downloading them again
+cartopy.config["data_dir"] = os.getenv(
+    "CARTOPY_DATA_DIR", cartopy.config["data_dir"]
+)
+
+
+@lru_cache(maxsize=4)
+def get_font(fname):
+    """Get the (cached) font properties for the given font file"""
+    return FontProperties(fname=fname)
+
+
 fig = plt.figure(figsize=(8, 8), dpi=128)
 
 ax = fig.add_axes(
@@ -33,7 +50,7 @@ text = ax.text(
     "Psy",
     transform=fig.transFigure,
     name="FreeSans",
-    fontproperties=FontProperties(fname=fontpath),
+    fontproperties=get_font(fontpath),
     size=256,
     ha="center",
     va="center",
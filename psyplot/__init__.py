@@ -9,16 +9,11 @@
 import datetime as dt
 import logging as _logging
 import sys
+from copy import deepcopy as _deepcopy
+from importlib import import_module
 
 import psyplot.config as config
 from psyplot.config.rcsetup import rcParams
-from psyplot.data import (  # noqa: F401
-    ArrayList,
-    InteractiveArray,
-    InteractiveList,
-    open_dataset,
-    open_mfdataset,
-)
 from psyplot.warning import critical, disable_warnings, warn  # noqa: F401
 
 from ._version import get_versions
@@ -43,18 +38,48 @@ __status__ = "Production"
 
 
 logger = _logging.getLogger(__name__)
-logger.debug(
-    "%s: Initializing psyplot, version %s",
-    dt.datetime.now().isoformat(),
-    __version__,
-)
-logger.debug("Logging configuration file: %s", config.logcfg_path)
-logger.debug("Configuration file: %s", config.config_path)
+if logger.isEnabledFor(_logging.DEBUG):
+    logger.debug(
+        "%s: Initializing psyplot, version %s",
+        dt.datetime.now().isoformat(),
+        __version__,
+    )
+    logger.debug("Logging configuration file: %s", config.logcfg_path)
+    logger.debug("Configuration file: %s", config.config_path)
 
 
 rcParams.HEADER += "\n\npsyplot version: " + __version__
-rcParams.load_plugins()
-rcParams.load_from_file()
+# plugins and the configuration file are loaded on the first access of the
+# rcParams
+rcParams.defer_loading()
+
+
+#: Mapping from top-level attributes to the modules they are imported from on
+#: first access. This avoids importing the scientific stack (numpy, xarray,
+#: etc.) with ``import psyplot``
+_lazy_imports = {
+    "ArrayList": "psyplot.data",
+    "InteractiveArray": "psyplot.data",
+    "InteractiveList": "psyplot.data",
+    "open_dataset": "psyplot.data",
+    "open_mfdataset": "psyplot.data",
+}
+
+
+def __getattr__(name):
+    try:
+        modname = _lazy_imports[name]
+    except KeyError:
+        raise AttributeError(
+            "module %r has no attribute %r" % (__name__, name)
+        ) from None
+    val = getattr(import_module(modname), name)
+    globals()[name] = val
+    return val
+
+
+def __dir__():
+    return sorted(set(globals()).union(_lazy_imports))
 
 
 _project_imported = False
@@ -76,7 +101,9 @@ def get_versions(requirements=True, key=None):
         A function that determines whether a plugin shall be considererd or
         not. The function must take a single argument, that is the name of the
         plugin as string, and must return True (import the plugin) or False
-        (skip the plugin). If None, all plugins are imported
+        (skip the plugin). If None, all plugins are imported. Note that
+        the :attr:`rcParams` (and with them all enabled plugins) are loaded
+        first, if that has been deferred
 
     Returns
     -------
@@ -114,10 +141,10 @@ def get_versions(requirements=True, key=None):
     """
     from psyplot.utils import plugin_entrypoints
 
-    eps = plugin_entrypoints("psyplot", "plugin")
+    rcParams.ensure_loaded()
 
     ret = {"psyplot": _get_versions(requirements)}
-    for ep in eps:
+    for ep in plugin_entrypoints("psyplot", "plugin"):
         if str(ep) in rcParams._plugins:
             logger.debug("Loading entrypoint %s", ep)
 
@@ -128,6 +155,10 @@ def get_versions(requirements=True, key=None):
 
             if key is not None and not key(ep.module):
                 continue
+            cache_key = (str(ep.module), bool(requirements))
+            if cache_key in _versions_cache:
+                ret[cache_key[0]] = _deepcopy(_versions_cache[cache_key])
+                continue
             try:
                 mod = ep.load()
             except (ImportError, ModuleNotFoundError):
@@ -135,41 +166,70 @@ def get_versions(requirements=True, key=None):
                 logger.warning("Could not import %s" % (ep,), exc_info=True)
             else:
                 try:
-                    ret[str(ep.module)] = mod.get_versions(requirements)
+                    versions = mod.get_versions(requirements)
                 except AttributeError:
-                    ret[str(ep.module)] = {
+                    versions = {
                         "version": getattr(
                             mod,
                             "plugin_version",
                             getattr(mod, "__version__", ""),
                         )
                     }
+                _versions_cache[cache_key] = versions
+                ret[cache_key[0]] = _deepcopy(versions)
     if key is None:
-        try:
-            import psyplot_gui
-        except ImportError:
-            pass
-        else:
-            ret["psyplot_gui"] = psyplot_gui.get_versions(requirements)
+        cache_key = ("psyplot_gui", bool(requirements))
+        if cache_key not in _versions_cache:
+            # failed imports are not cached by python, so we remember them
+            try:
+                import psyplot_gui
+            except ImportError:
+                _versions_cache[cache_key] = None
+            else:
+                _versions_cache[cache_key] = psyplot_gui.get_versions(
+                    requirements
+                )
+        if _versions_cache[cache_key] is not None:
+            ret["psyplot_gui"] = _deepcopy(_versions_cache[cache_key])
     return ret
 
 
+#: Cache for the version information of psyplot, its plugins and the GUI.
+#: Maps the module name and the `requirements` flag to the version information
+#: (or None, if the module could not be imported)
+_versions_cache = {}
+
+
 def _get_versions(requirements=True):
+    cache_key = ("psyplot", bool(requirements))
+    if cache_key in _versions_cache:
+        return _deepcopy(_versions_cache[cache_key])
     if requirements:
-        import matplotlib as mpl
-        import numpy as np
-        import pandas as pd
-        import xarray as xr
-
-        return {
+        versions = {
             "version": __version__,
             "requirements": {
-                "matplotlib": mpl.__version__,
-                "xarray": xr.__version__,
-                "pandas": pd.__version__,
-                "numpy": np.__version__,
+                "matplotlib": _get_requirement_version("matplotlib"),
+                "xarray": _get_requirement_version("xarray"),
+                "pandas": _get_requirement_version("pandas"),
+                "numpy": _get_requirement_version("numpy"),
                 "python": " ".join(sys.version.splitlines()),
             },
         }
     else:
-        return {"version": __version__}
+        versions = {"version": __version__}
+    _versions_cache[cache_key] = versions
+    return _deepcopy(versions)
+
+
+def _get_requirement_version(name):
+    """Get the version of a requirement
+
+    The version is taken from the package metadata, so we do not have to
+    import the (heavy) package. If this fails, the ``__version__`` of the
+    package is used."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return import_module(name).__version__
@@ -9,22 +9,15 @@
 # SPDX-License-Identifier: LGPL-3.0-only
 
 import argparse
-import glob
 import logging
+import os
 import os.path as osp
-import pickle
 import sys
 from collections import defaultdict
-from itertools import chain
-
-import six
-import xarray as xr
-import yaml
-from funcargparse import FuncArgParser
+from functools import lru_cache, partial
 
 import psyplot
 from psyplot.docstring import docstrings
-from psyplot.utils import get_default_value
 from psyplot.warning import warn
 
 rcParams = psyplot.rcParams
@@ -33,6 +26,19 @@ rcParams = psyplot.rcParams
 logger = logging.getLogger(__name__)
 
 
+class _ConcatDimDefault:
+    """Placeholder for the default `concat_dim` of :func:`make_plot`"""
+
+    def __repr__(self):
+        return "'__infer_concat_dim__'"
+
+
+#: Default value for the `concat_dim` parameter of :func:`make_plot`. It is
+#: replaced by the default of :func:`xarray.open_mfdataset` at runtime, such
+#: that xarray is only imported when a plot is made
+_concat_dim_default = _ConcatDimDefault()
+
+
 def main(args=None):
     """Main function for usage of psyplot from the command line
 
@@ -48,6 +54,13 @@ def main(args=None):
         from psyplot_gui import get_parser as _get_parser
     except (ImportError, ModuleNotFoundError):
         logger.debug("Failed to import gui", exc_info=True)
+        if args is None:
+            args = sys.argv[1:]
+        # options that only print information do not need the full parser
+        # (and the plugins that it loads)
+        if len(args) == 1 and args[0] in _info_options:
+            _info_options[args[0]]()
+            sys.exit(0)
         parser = get_parser(create=False)
         parser.update_arg("output", required=True)
         parser.create_arguments()
@@ -75,7 +88,7 @@ def make_plot(
     enable_post=False,
     seaborn_style=None,
     output_project=None,
-    concat_dim=get_default_value(xr.open_mfdataset, "concat_dim"),
+    concat_dim=_concat_dim_default,
     chname={},
     preset=None,
 ):
@@ -128,7 +141,8 @@ def make_plot(
         The name of a project file to save the project to
     concat_dim: str
         The concatenation dimension if multiple files in `fnames` are
-        provided
+        provided. By default, the default of :func:`xarray.open_mfdataset`
+        is used
     chname: dict
         A mapping from variable names in the project to variable names in the
         datasets that should be used instead
@@ -147,7 +161,10 @@ def make_plot(
         rcParams.load_from_file(rc_file)
 
     if dims is not None and not isinstance(dims, dict):
-        dims = dict(chain(*map(six.iteritems, dims)))
+        merged = {}
+        for d in dims:
+            merged.update(d)
+        dims = merged
 
     if len(output) == 1:
         output = output[0]
@@ -167,13 +184,18 @@ def make_plot(
         sns.set_style(seaborn_style)
     import psyplot.project as psy
 
+    if concat_dim is _concat_dim_default:
+        concat_dim = psy._concat_dim_default
+
     if project is not None:
         fnames = [s.split(",") for s in fnames]
         chname = dict(chname)
-        single_files = (fn_list[0] for fn_list in fnames if len(fn_list) == 1)
-        alternative_paths = defaultdict(lambda: next(single_files, None))
-        alternative_paths.update(
-            (fn_list for fn_list in fnames if len(fn_list) == 2)
+        single_files = [fn_list[0] for fn_list in fnames if len(fn_list) == 1]
+        # files without an explicit mapping replace the ones of the project
+        # in the order they are requested
+        alternative_paths = defaultdict(
+            partial(next, iter(single_files), None),
+            (fn_list for fn_list in fnames if len(fn_list) == 2),
         )
         p = psy.Project.load_project(
             project,
@@ -209,15 +231,12 @@ def make_plot(
     return
 
 
-def get_parser(create=True):
-    """Return a parser to make that can be used to make plots or open files
-    from the command line
+@lru_cache(maxsize=1)
+def _get_epilog():
+    """Get the examples for the epilog of the command line parser
 
-    Returns
-    -------
-    psyplot.parser.FuncArgParser
-        The :class:`argparse.ArgumentParser` instance"""
-    #: The parse that is used to parse arguments from the command line
+    The docstring is parsed only once because :func:`get_parser` is called
+    multiple times."""
     epilog = docstrings.get_sections(
         docstrings.dedent(
             """
@@ -261,12 +280,24 @@ def get_parser(create=True):
         ["Examples"],
     )
 
-    epilog = ".. rubric:: Examples\n" + "\n".join(epilog.splitlines()[2:])
+    return ".. rubric:: Examples\n" + "\n".join(epilog.splitlines()[2:])
+
+
+def get_parser(create=True):
+    """Return a parser to make that can be used to make plots or open files
+    from the command line
+
+    Returns
+    -------
+    psyplot.parser.FuncArgParser
+        The :class:`argparse.ArgumentParser` instance"""
+    from funcargparse import FuncArgParser
 
+    #: The parse that is used to parse arguments from the command line
     parser = FuncArgParser(
         description="""
         Load a dataset, make the plot and save the result to a file""",
-        epilog=epilog,
+        epilog=_get_epilog(),
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
 
@@ -349,17 +380,7 @@ def get_parser(create=True):
         metavar="dim,val1[,val2[,...]]",
     )
 
-    pm_choices = {
-        pm
-        for pm, d in filter(
-            lambda t: t[1].get("plot_func", True),
-            six.iteritems(rcParams["project.plotters"]),
-        )
-    }
-    if psyplot._project_imported:
-        import psyplot.project as psy
-
-        pm_choices.update(set(psy.plot._plot_methods))
+    pm_choices = set(_get_plot_methods())
     parser.update_arg(
         "plot_method",
         short="pm",
@@ -413,20 +434,88 @@ def get_parser(create=True):
     return parser
 
 
+def _get_plot_methods():
+    """Get the available plot methods
+
+    Returns
+    -------
+    dict
+        A mapping from plot method name to its summary"""
+    pm_choices = {
+        pm: d.get("summary")
+        or (
+            "Open and plot data via :class:`%s.%s` plotters"
+            % (d["module"], d["plotter_name"])
+        )
+        for pm, d in rcParams["project.plotters"].items()
+        if d.get("plot_func", True)
+    }
+    if psyplot._project_imported:
+        import psyplot.project as psy
+
+        pm_choices.update(psy.plot._plot_methods)
+    return pm_choices
+
+
 def _load_dict(fname):
-    with open(fname) as f:
+    with open(fname, "rb") as f:
         if fname.endswith(".yml") or fname.endswith(".yaml"):
-            return yaml.load(f, Loader=yaml.SafeLoader)
-        return pickle.load(f)
+            import yaml
+
+            from psyplot.config.rcsetup import _YamlLoader
+
+            return yaml.load(f, Loader=_YamlLoader)
+        import pickle
+
+        return pickle.loads(f.read())
+
+
+def _yaml_dump(obj):
+    """Dump `obj` to a yaml string using the libyaml emitter if available"""
+    import yaml
+
+    from psyplot.config.rcsetup import _YamlDumper
+
+    return yaml.dump(obj, Dumper=_YamlDumper, default_flow_style=False)
 
 
 def _load_dims(s):
-    s = s.split(",")
-    if len(s) > 1:
-        return {s[0]: list(map(int, s[1:]))}
+    name, _, values = s.partition(",")
+    if values:
+        return {name: [int(val) for val in values.split(",")]}
     return {}
 
 
+def _print_version():
+    print(psyplot.__version__)
+
+
+def _print_all_versions():
+    print(_yaml_dump(psyplot.get_versions()))
+
+
+def _print_plugins():
+    from psyplot.config.rcsetup import RcParams
+
+    # the enabled plugins are determined from their entry points with a
+    # separate instance, so we neither import them nor modify the rcParams
+    rc = RcParams(defaultParams={})
+    print(_yaml_dump([str(ep) for ep in rc._load_plugin_entrypoints()]))
+
+
+#: Mapping from command line options to the functions that print the
+#: corresponding information. These options are handled by :func:`main`
+#: without creating the parser if they are the only argument
+_info_options = {
+    "-V": _print_version,
+    "--version": _print_version,
+    "-aV": _print_all_versions,
+    "--all-versions": _print_all_versions,
+    "-lp": _print_plugins,
+    "--list-plugins": _print_plugins,
+}
+
+
 class AllVersionsAction(argparse.Action):
     def __init__(
         self,
@@ -447,7 +536,7 @@ class AllVersionsAction(argparse.Action):
         )
 
     def __call__(self, parser, namespace, values, option_string=None):
-        print(yaml.dump(psyplot.get_versions(), default_flow_style=False))
+        _print_all_versions()
         sys.exit(0)
 
 
@@ -473,10 +562,14 @@ class ListPresetsAction(argparse.Action):
         if not osp.exists(presets_dir):
             sys.exit(0)
         else:
-            presets = {
-                osp.splitext(osp.basename(fname))[0]: fname
-                for fname in glob.glob(osp.join(presets_dir, "*.yml"))
-            }
+            with os.scandir(presets_dir) as entries:
+                presets = {
+                    entry.name[:-4]: entry.path
+                    for entry in entries
+                    if entry.name.endswith(".yml")
+                    and not entry.name.startswith(".")
+                    and entry.is_file()
+                }
             print("\n".join(map(": ".join, presets.items())))
             sys.exit(0)
 
@@ -499,7 +592,7 @@ class ListPluginsAction(argparse.Action):
         )
 
     def __call__(self, parser, namespace, values, option_string=None):
-        print(yaml.dump(psyplot.rcParams._plugins, default_flow_style=False))
+        _print_plugins()
         sys.exit(0)
 
 
@@ -521,23 +614,96 @@ class ListPlotMethodsAction(argparse.Action):
         )
 
     def __call__(self, parser, namespace, values, option_string=None):
-        pm_choices = {}
-        for pm, d in filter(
-            lambda t: t[1].get("plot_func", True),
-            six.iteritems(rcParams["project.plotters"]),
-        ):
-            pm_choices[pm] = d.get("summary") or (
-                "Open and plot data via :class:`%s.%s` plotters"
-                % (d["module"], d["plotter_name"])
-            )
-        if psyplot._project_imported:
-            import psyplot.project as psy
-
-            pm_choices.update(psy.plot._plot_methods)
-        print(yaml.dump(pm_choices, default_flow_style=False))
+        print(_yaml_dump(_get_plot_methods()))
         sys.exit(0)
 
 
+#: builtin types that are unpickled as they are by :func:`_load_project_arrays`
+_safe_builtins = {
+    "dict",
+    "list",
+    "tuple",
+    "set",
+    "frozenset",
+    "str",
+    "bytes",
+    "bytearray",
+    "int",
+    "float",
+    "complex",
+    "bool",
+    "slice",
+    "range",
+}
+
+#: further globals that are unpickled by :func:`_load_project_arrays`, e.g.
+#: for numpy scalars in the file names of the datasets
+_safe_globals = {
+    ("collections", "OrderedDict"),
+    ("collections", "defaultdict"),
+    ("_codecs", "encode"),
+    ("numpy", "dtype"),
+    ("numpy.core.multiarray", "scalar"),
+    ("numpy._core.multiarray", "scalar"),
+}
+
+
+class _PickleStub(object):
+    """Placeholder for objects that are skipped by
+    :func:`_load_project_arrays`"""
+
+    def __new__(cls, *args, **kwargs):
+        return object.__new__(cls)
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __setstate__(self, state):
+        pass
+
+    def __setitem__(self, key, value):
+        pass
+
+    def append(self, value):
+        pass
+
+    def extend(self, values):
+        pass
+
+
+def _load_project_arrays(fname):
+    """Load the ``'arrays'`` of a pickled project without its heavy objects
+
+    This function unpickles a file that has been created with the
+    :meth:`psyplot.project.Project.save_project` method but replaces every
+    object that is not a plain python container (e.g. datasets, numpy arrays
+    or matplotlib objects) by an empty placeholder. This is sufficient to
+    extract the file names of the datasets and avoids importing and
+    constructing the full project.
+
+    Parameters
+    ----------
+    fname: str
+        The path to the pickled project
+
+    Returns
+    -------
+    dict
+        The ``'arrays'`` of the project"""
+    import pickle
+
+    class Unpickler(pickle.Unpickler):
+        def find_class(self, module, name):
+            if module == "builtins" and name in _safe_builtins:
+                return super().find_class(module, name)
+            if (module, name) in _safe_globals:
+                return super().find_class(module, name)
+            return _PickleStub
+
+    with open(fname, "rb") as f:
+        return Unpickler(f).load()["arrays"]
+
+
 class ListDsNamesAction(argparse.Action):
     """An action to list the used file names in a project"""
 
@@ -563,17 +729,14 @@ class ListDsNamesAction(argparse.Action):
                 "%s -p <project-file>.pkl %s" % (parser.prog, option_string)
             )
             sys.exit(1)
-        import pickle
-
         import psyplot.data as psyd
 
-        with open(namespace.project, "rb") as f:
-            d = pickle.load(f)["arrays"]
+        d = _load_project_arrays(namespace.project)
         names = list(
             filter(None, (t[0] for t in psyd.ArrayList._get_dsnames(d)))
         )
         if names:
-            print(yaml.dump(names, default_flow_style=False))
+            print(_yaml_dump(names))
         sys.exit(0)
 
 
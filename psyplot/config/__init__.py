@@ -13,12 +13,23 @@ dictionary, however you can set up your own configuration in a yaml file (see
 # SPDX-License-Identifier: LGPL-3.0-only
 
 from .logsetup import setup_logging
-from .rcsetup import psyplot_fname
 
 #: :class:`str`. Path to the yaml logging configuration file
 logcfg_path = setup_logging()
 
 
-#: class:`str` or ``None``. Path to the yaml configuration file (if found).
-#: See :func:`~psyplot.config.rcsetup.psyplot_fname` for further information
-config_path = psyplot_fname()
+def __getattr__(name):
+    # the configuration file is only searched when needed
+    if name == "config_path":
+        from .rcsetup import psyplot_fname
+
+        #: class:`str` or ``None``. Path to the yaml configuration file (if
+        #: found). See :func:`~psyplot.config.rcsetup.psyplot_fname` for
+        #: further information
+        globals()[name] = value = psyplot_fname()
+        return value
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()).union(["config_path"]))
@@ -13,13 +13,67 @@ This module defines the essential functions for setting up the
 import logging
 import logging.config
 import os
-import sys
+from collections import OrderedDict
+from copy import deepcopy
 
-import six
 import yaml
 
 from psyplot.docstring import dedent
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML has been built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+
+#: Cache of parsed yaml files (see :func:`_load_yaml`). Maps the path of the
+#: file to its modification time, size and the parsed content
+_YAML_CACHE = OrderedDict()
+
+#: Maximum number of files in the :data:`_YAML_CACHE`
+_YAML_CACHE_SIZE = 16
+
+#: True if :func:`setup_logging` already applied the default configuration
+_INITIALIZED = False
+
+#: The path that has been returned when the default configuration has been
+#: applied by :func:`setup_logging`
+_LAST_PATH = None
+
+
+def _load_yaml(path):
+    """Load the yaml configuration file in `path`
+
+    The parsed file is cached as long as its modification time and size do
+    not change.
+
+    Parameters
+    ----------
+    path: str
+        The path to the yaml file
+
+    Returns
+    -------
+    dict
+        A copy of the parsed content"""
+    st = os.stat(path)
+    key = (st.st_mtime_ns, st.st_size)
+    try:
+        mtime, size, config = _YAML_CACHE[path]
+    except KeyError:
+        pass
+    else:
+        if (mtime, size) == key:
+            _YAML_CACHE.move_to_end(path)
+            return deepcopy(config)
+    with open(path, "rb") as f:
+        config = yaml.load(f, Loader=_YamlLoader)
+    _YAML_CACHE[path] = key + (config,)
+    _YAML_CACHE.move_to_end(path)
+    while len(_YAML_CACHE) > _YAML_CACHE_SIZE:
+        _YAML_CACHE.popitem(last=False)
+    return deepcopy(config)
+
 
 def _get_home():
     """Find user's home directory if possible.
@@ -30,10 +84,7 @@ def _get_home():
     This function is copied from matplotlib version 1.4.3, Jan 2016
     """
     try:
-        if six.PY2 and sys.platform == "win32":
-            path = os.path.expanduser(b"~").decode(sys.getfilesystemencoding())
-        else:
-            path = os.path.expanduser("~")
+        path = os.path.expanduser("~")
     except ImportError:
         # This happens on Google App Engine (pwd module is not present).
         pass
@@ -49,7 +100,10 @@ def _get_home():
 
 @dedent
 def setup_logging(
-    default_path=None, default_level=logging.INFO, env_key="LOG_PSYPLOT"
+    default_path=None,
+    default_level=logging.INFO,
+    env_key="LOG_PSYPLOT",
+    force=False,
 ):
     """
     Setup logging configuration
@@ -65,6 +119,9 @@ def setup_logging(
     env_key: str
         environment variable specifying a different logging file than
         `default_path` (Default: 'LOG_CFG')
+    force: bool
+        If True, apply the configuration even if the default configuration
+        has already been applied in this process
 
     Returns
     -------
@@ -75,21 +132,31 @@ def setup_logging(
     -----
     Function taken from
     http://victorlin.me/posts/2012/08/26/good-logging-practice-in-python"""
+    global _INITIALIZED, _LAST_PATH
+
+    value = os.getenv(env_key, None)
+    use_default = default_path is None and not value
+    if use_default and _INITIALIZED and not force:
+        return _LAST_PATH
     path = default_path or os.path.join(
         os.path.dirname(__file__), "logging.yml"
     )
-    value = os.getenv(env_key, None)
-    home = _get_home()
     if value:
         path = value
     if os.path.exists(path):
-        with open(path, "rt") as f:
-            config = yaml.load(f.read(), Loader=yaml.SafeLoader)
+        config = _load_yaml(path)
+        home = None
         for handler in config.get("handlers", {}).values():
             if "~" in handler.get("filename", ""):
+                # only look for the home directory if it is needed
+                if home is None:
+                    home = _get_home()
                 handler["filename"] = handler["filename"].replace("~", home)
         logging.config.dictConfig(config)
     else:
         path = None
         logging.basicConfig(level=default_level)
+    if use_default:
+        _INITIALIZED = True
+        _LAST_PATH = path
     return path
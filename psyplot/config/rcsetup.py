@@ -20,17 +20,24 @@ import logging
 import os
 import re
 import sys
+import threading
 from collections import UserDict, defaultdict
 from itertools import chain
 
-import six
 import yaml
 
-from psyplot.config.logsetup import _get_home
+from psyplot.config.logsetup import _get_home, _load_yaml
 from psyplot.docstring import dedent, docstrings, safe_modulo
 from psyplot.utils import isstring
 from psyplot.warning import warn
 
+try:
+    from yaml import CDumper as _YamlDumper
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML has been built without libyaml
+    from yaml import Dumper as _YamlDumper
+    from yaml import SafeLoader as _YamlLoader
+
 
 @docstrings.get_sections(base="safe_list")
 @dedent
@@ -57,6 +64,28 @@ def safe_list(iterable):
         return [iterable]
 
 
+#: Pattern to find references to groups (backreferences and conditionals)
+#: in the patterns of a :class:`SubDict`
+_backref_patt = re.compile(r"\\\d|\(\?P=|\(\?\(")
+
+#: Cache of the loaded plugin modules, mapping the distribution name, the
+#: distribution version and the entry point to the module
+_plugin_cache = {}
+
+
+def _plugin_cache_key(ep):
+    """Get the key for an entry point in the :data:`_plugin_cache`"""
+    value = getattr(ep, "value", str(ep))
+    dist = getattr(ep, "dist", None)
+    if dist is None:
+        return (None, None, ep.name, value)
+    try:
+        name = dist.name
+    except AttributeError:  # pkg_resources
+        name = dist.project_name
+    return (name, dist.version, ep.name, value)
+
+
 class SubDict(UserDict, dict):  # type: ignore
     """Class that keeps week reference to the base dictionary
 
@@ -96,12 +125,14 @@ class SubDict(UserDict, dict):  # type: ignore
         value = bool(value)
         if hasattr(self, "_replace") and value == self._replace:
             return
-        if not hasattr(self, "_replace"):
+        if not hasattr(self, "_replace") or not dict.__len__(self):
+            # there are no keys that need to be renamed
             self._replace = value
             return
         # if the value has changed, we change the key in the SubDict instance
         # to match the ones in the base dictionary (if they exist)
-        for key, val in iter(dict.items(self)):
+        # copy the items because the keys are changed in the loop
+        for key, val in list(dict.items(self)):
             try:
                 if value:
                     new_key = replace_base(key)
@@ -127,6 +158,10 @@ class SubDict(UserDict, dict):  # type: ignore
     #: :class:`bool`. If True, changes are traced back to the :attr:`base` dict
     trace = False
 
+    #: The :attr:`patterns` and the regular expression that combines them (see
+    #: :meth:`_get_combined_pattern`)
+    _combined_pattern = ((), None, [])
+
     @docstrings.get_sections(base="SubDict.add_base_str")
     @dedent
     def add_base_str(
@@ -172,17 +207,10 @@ class SubDict(UserDict, dict):  # type: ignore
         else:
             pattern_base = base_str
         self.base_str = base_str + self.base_str
-        self.patterns = (
-            list(
-                map(
-                    lambda s: re.compile(
-                        s.replace("%(key)s", "(?P<key>%s)" % pattern)
-                    ),
-                    pattern_base,
-                )
-            )
-            + self.patterns
-        )
+        key_group = "(?P<key>%s)" % pattern
+        self.patterns = [
+            re.compile(s.replace("%(key)s", key_group)) for s in pattern_base
+        ] + self.patterns
 
     docstrings.delete_params("SubDict.add_base_str.parameters", "append")
 
@@ -278,7 +306,7 @@ class SubDict(UserDict, dict):  # type: ignore
         )
 
     def __getitem__(self, key):
-        if key in iter(dict.keys(self)):
+        if dict.__contains__(self, key):
             return dict.__getitem__(self, key)
         if not self.replace:
             return self.base[key]
@@ -305,46 +333,119 @@ class SubDict(UserDict, dict):  # type: ignore
         self.base[key] = val
 
     def _get_val_and_base(self, key):
-        found = False
-        e = None
+        base = self.base
         for s, patt in self._iter_base_and_pattern(key):
-            found = True
+            m = patt.match(s)
+            if m:
+                try:
+                    return m.group(), base[m.group()]
+                except KeyError:
+                    pass
+        raise KeyError("{0} does not match the specified pattern!".format(key))
+
+    def _iter_base_and_pattern(self, key):
+        meta = {"key": key}
+        is_str = isinstance(key, str)
+        for s, patt in zip(self.base_str, self.patterns):
+            # most base strings are a literal prefix followed by the key
+            if is_str and s.endswith("%(key)s") and "%" not in s[:-7]:
+                yield s[:-7] + key, patt
+            else:
+                yield safe_modulo(s, meta), patt
+
+    def _get_combined_pattern(self):
+        """Combine the :attr:`patterns` into one alternation
+
+        The regex engine tries the alternatives in the order of the
+        :attr:`patterns`, such that one match of the combined pattern gives
+        the same result as trying the patterns one after another.
+
+        Returns
+        -------
+        re.Pattern or None
+            The combined pattern or None, if the patterns cannot be combined
+            because they refer to groups or contain flags
+        list of int
+            The number of the ``key`` group in the combined pattern for each
+            group of the combined pattern"""
+        patterns = tuple(self.patterns)
+        if self._combined_pattern[0] == patterns:
+            return self._combined_pattern[1:]
+        combined = None
+        key_groups = []
+        if patterns and all(
+            "key" in patt.groupindex
+            and not patt.flags & ~re.UNICODE
+            and not _backref_patt.search(patt.pattern)
+            for patt in patterns
+        ):
+            for patt in patterns:
+                key_group = len(key_groups) + patt.groupindex["key"]
+                key_groups.extend([key_group] * patt.groups)
             try:
-                m = patt.match(s)
-                if m:
-                    return m.group(), self.base[m.group()]
-                else:
-                    raise KeyError(
-                        "{0} does not match the specified pattern!".format(s)
+                combined = re.compile(
+                    "|".join(
+                        "(?:%s)" % patt.pattern.replace("(?P<key>", "(", 1)
+                        for patt in patterns
                     )
-            except KeyError:
+                )
+            except re.error:
                 pass
-        if not found:
-            if e is not None:
-                raise
-        raise KeyError("{0} does not match the specified pattern!".format(key))
+            else:
+                if combined.groups != len(key_groups):
+                    combined = None
+        self._combined_pattern = (patterns, combined, key_groups)
+        return combined, key_groups
 
-    def _iter_base_and_pattern(self, key):
-        return zip(
-            map(lambda s: safe_modulo(s, {"key": key}), self.base_str),
-            self.patterns,
-        )
+    def _iter_base_matches(self):
+        """Iterate over the matches of the keys in :attr:`base`
+
+        Yields
+        ------
+        re.Match
+            The match of the first pattern in :attr:`patterns` that matches
+            the key
+        int or str
+            The group of the match that corresponds to ``%(key)s``"""
+        combined, key_groups = self._get_combined_pattern()
+        if combined is not None:
+            for key in self.base:
+                m = combined.match(key)
+                if m is None:
+                    continue
+                elif m.lastindex is None:
+                    # no group took part in the match, so we do not know
+                    # which pattern matched
+                    m = self._match_patterns(key)
+                    if m is not None:
+                        yield m, "key"
+                else:
+                    # the last closed group belongs to the matching pattern
+                    yield m, key_groups[m.lastindex - 1]
+            return
+        for key in self.base:
+            m = self._match_patterns(key)
+            if m is not None:
+                yield m, "key"
+
+    def _match_patterns(self, key):
+        """Match `key` with the first matching pattern in :attr:`patterns`"""
+        for pattern in self.patterns:
+            m = pattern.match(key)
+            if m:
+                return m
+        return None
 
     def iterkeys(self):
         """Unsorted iterator over keys"""
-        patterns = self.patterns
         replace = self.replace
         seen = set()
-        for key in six.iterkeys(self.base):
-            for pattern in patterns:
-                m = pattern.match(key)
-                if m:
-                    ret = m.group("key") if replace else m.group()
-                    if ret not in seen:
-                        seen.add(ret)
-                        yield ret
-                    break
-        for key in iter(dict.keys(self)):
+        for m, group in self._iter_base_matches():
+            ret = m.group(group) if replace else m.group()
+            if ret not in seen:
+                seen.add(ret)
+                yield ret
+        for key in dict.keys(self):
             if key not in seen:
                 yield key
 
@@ -358,7 +459,7 @@ class SubDict(UserDict, dict):  # type: ignore
 
     def update(self, *args, **kwargs):
         """Update the dictionary"""
-        for k, v in six.iteritems(dict(*args, **kwargs)):
+        for k, v in dict(*args, **kwargs).items():
             self[k] = v
 
 
@@ -381,7 +482,7 @@ class RcParams(dict):
         depr = self._all_deprecated
         return dict(
             (key, val[1])
-            for key, val in six.iteritems(self.defaultParams)
+            for key, val in self.defaultParams.items()
             if key not in depr
         )
 
@@ -390,7 +491,7 @@ class RcParams(dict):
         """The description of each keyword in the rcParams dictionary"""
         return {
             key: val[2]
-            for key, val in six.iteritems(self.defaultParams)
+            for key, val in self.defaultParams.items()
             if len(val) >= 3
         }
 
@@ -410,12 +511,23 @@ environment variable."""
     #: :meth:`load_plugins` method
     _plugins = []
 
+    #: If True, the plugins and the configuration file are loaded on the first
+    #: access of this instance. See :meth:`defer_loading`
+    _deferred_load = False
+
+    #: True while :meth:`ensure_loaded` loads this instance
+    _loading = False
+
+    #: Lock to prevent that the deferred loading runs in multiple threads
+    _load_lock = threading.RLock()
+
     @property
     def _all_deprecated(self):
         return set(chain(self._deprecated_ignore_map, self._deprecated_map))
 
     @property
     def defaultParams(self):
+        self.ensure_loaded()
         return getattr(self, "_defaultParams", defaultParams)
 
     @defaultParams.setter
@@ -446,7 +558,7 @@ environment variable."""
             self.defaultParams = defaultParams
         self._deprecated_map = {}
         self._deprecated_ignore_map = {}
-        for k, v in six.iteritems(dict(*args, **kwargs)):
+        for k, v in dict(*args, **kwargs).items():
             try:
                 self[k] = v
             except (ValueError, RuntimeError):
@@ -463,14 +575,19 @@ environment variable."""
         if key is None:
             return
         try:
-            cval = self.validate[key](val)
+            # _get_depreceated made sure that key is in the defaultParams
+            cval = self.defaultParams[key][1](val)
         except ValueError as ve:
             raise ValueError("Key %s: %s" % (key, str(ve)))
         dict.__setitem__(self, key, cval)
-        for func in self._connections.get(key, []):
-            func(cval)
+        connections = self._connections
+        if key in connections:
+            for func in connections[key]:
+                func(cval)
 
     def _get_depreceated(self, key, *args):
+        # the deprecated keys of the plugins are only known after loading
+        self.ensure_loaded()
         if key in self._deprecated_map:
             alt_key, alt_val = self._deprecated_map[key]
             warn(self.msg_depr % (key, alt_key))
@@ -492,6 +609,110 @@ environment variable."""
         if key is not None:
             return dict.__getitem__(self, key)
 
+    def __contains__(self, key):
+        self.ensure_loaded()
+        return dict.__contains__(self, key)
+
+    def __iter__(self):
+        self.ensure_loaded()
+        return dict.__iter__(self)
+
+    def get(self, key, default=None):
+        self.ensure_loaded()
+        return dict.get(self, key, default)
+
+    def items(self):
+        self.ensure_loaded()
+        return dict.items(self)
+
+    def __len__(self):
+        self.ensure_loaded()
+        return dict.__len__(self)
+
+    def __delitem__(self, key):
+        self.ensure_loaded()
+        dict.__delitem__(self, key)
+
+    def pop(self, key, *args):
+        self.ensure_loaded()
+        return dict.pop(self, key, *args)
+
+    def popitem(self):
+        self.ensure_loaded()
+        return dict.popitem(self)
+
+    def setdefault(self, key, default=None):
+        self.ensure_loaded()
+        return dict.setdefault(self, key, default)
+
+    def __eq__(self, other):
+        self.ensure_loaded()
+        if isinstance(other, RcParams):
+            other.ensure_loaded()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other):
+        self.ensure_loaded()
+        if isinstance(other, RcParams):
+            other.ensure_loaded()
+        return dict.__ne__(self, other)
+
+    def defer_loading(self):
+        """Defer the loading of the plugins and the configuration file
+
+        Instead of calling :meth:`load` directly, it is called on the first
+        access of this instance through its own methods (item access,
+        ``in``, iteration, ``len``, comparisons, :meth:`keys`, :meth:`items`,
+        ``del``, :meth:`pop`, :meth:`setdefault`, etc.). Calling the methods
+        of :class:`dict` directly (e.g. ``dict.keys(rcParams)``) bypasses
+        this and only sees the values that have been loaded so far.
+
+        See Also
+        --------
+        ensure_loaded"""
+        self._deferred_load = True
+
+    def ensure_loaded(self):
+        """Load the plugins and the configuration file if this was deferred
+
+        See Also
+        --------
+        defer_loading"""
+        if not self._deferred_load:
+            return
+        with self._load_lock:
+            # the lock is reentrant, so the accesses of :meth:`load` to this
+            # instance end up here, too. Other threads wait until it finished
+            if not self._deferred_load or self._loading:
+                return
+            self._loading = True
+            try:
+                self.load()
+            finally:
+                # on failure, we try again on the next access
+                self._loading = False
+            self._deferred_load = False
+
+    def load(self, plugins=True, from_file=True, fname=None):
+        """Load the plugins and the configuration file
+
+        Parameters
+        ----------
+        plugins: bool
+            If True, the plotters and defaultParams of the plugins are loaded
+            (see :meth:`load_plugins`)
+        from_file: bool
+            If True, the instance is updated from the configuration file
+            (see :meth:`load_from_file`). This happens after the plugins
+            have been loaded, such that the file may contain plugin keys
+        fname: str
+            Path to the yaml configuration file. If None, the
+            :func:`psyplot_fname` function is used"""
+        if plugins:
+            self.load_plugins()
+        if from_file:
+            self.load_from_file(fname)
+
     def connect(self, key, func):
         """Connect a function to the given formatoption
 
@@ -539,7 +760,7 @@ environment variable."""
     # all of the validation over-ride update to force
     # through __setitem__
     def update(self, *args, **kwargs):
-        for k, v in six.iteritems(dict(*args, **kwargs)):
+        for k, v in dict(*args, **kwargs).items():
             try:
                 self[k] = v
             except (ValueError, RuntimeError):
@@ -576,8 +797,10 @@ environment variable."""
 
         class_name = self.__class__.__name__
         indent = len(class_name) + 1
+        self.ensure_loaded()
+        # use the plain dict items to skip the checks of __getitem__
         repr_split = pprint.pformat(
-            dict(self), indent=1, width=80 - indent
+            dict(dict.items(self)), indent=1, width=80 - indent
         ).split("\n")
         repr_indented = ("\n" + " " * indent).join(repr_split)
         return "{0}({1})".format(class_name, repr_indented)
@@ -591,6 +814,7 @@ environment variable."""
         """
         Return sorted list of keys.
         """
+        self.ensure_loaded()
         k = list(dict.keys(self))
         k.sort()
         return k
@@ -599,7 +823,7 @@ environment variable."""
         """
         Return values in order of sorted keys.
         """
-        return [self[k] for k in self.keys()]
+        return [dict.__getitem__(self, k) for k in self.keys()]
 
     def find_all(self, pattern):
         """
@@ -694,14 +918,10 @@ environment variable."""
         dump_to_file, psyplot_fname"""
         fname = fname or psyplot_fname()
         if fname and os.path.exists(fname):
-            with open(fname) as f:
-                d = yaml.load(f, Loader=yaml.SafeLoader)
-                self.update(d)
-                if (
-                    d.get("project.plotters.user")
-                    and "project.plotters" in self
-                ):
-                    self["project.plotters"].update(d["project.plotters.user"])
+            d = _load_yaml(fname)
+            self.update(d)
+            if d.get("project.plotters.user") and "project.plotters" in self:
+                self["project.plotters"].update(d["project.plotters.user"])
 
     def dump(
         self,
@@ -751,32 +971,29 @@ environment variable."""
                 "%s already exists! Set overwrite=True to overwrite it!"
                 % (fname)
             )
-        if six.PY2:
-            kwargs.setdefault("encoding", "utf-8")
         d = {
             key: val
-            for key, val in six.iteritems(self)
+            for key, val in self.items()
             if (include_keys is None or key in include_keys)
             and key not in exclude_keys
         }
         kwargs["default_flow_style"] = False
+        kwargs.setdefault("Dumper", _YamlDumper)
         if include_descriptions:
             s = yaml.dump(d, **kwargs)
             desc = self.descriptions
-            i = 2
             header = (
                 self.HEADER.splitlines()
                 + ["", "Created with python", ""]
                 + sys.version.splitlines()
                 + ["", ""]
             )
-            lines = ["# " + line for line in header] + s.splitlines()
-            for line in lines[2:]:
+            lines = ["# " + line for line in header]
+            for line in s.splitlines():
                 key = line.split(":")[0]
                 if key in desc:
-                    lines.insert(i, "# " + "\n# ".join(desc[key].splitlines()))
-                    i += 1
-                i += 1
+                    lines.append("# " + "\n# ".join(desc[key].splitlines()))
+                lines.append(line)
             s = "\n".join(lines)
             if fname is None:
                 return s
@@ -790,6 +1007,11 @@ environment variable."""
                 yaml.dump(d, f, **kwargs)
         return None
 
+    @staticmethod
+    def _clear_plugin_cache():
+        """Clear the cache of the plugin modules of :meth:`load_plugins`"""
+        _plugin_cache.clear()
+
     def _load_plugin_entrypoints(self):
         """Load the modules for the psyplot plugins
 
@@ -855,9 +1077,12 @@ environment variable."""
         logger = logging.getLogger(__name__)
 
         plotters = self["project.plotters"]
-        def_plots = {"default": list(plotters)}
         defaultParams = self.defaultParams
-        def_keys = {"default": defaultParams}
+        # mapping from plotter name or rcParams key to the plugins defining it
+        plot_owners = defaultdict(list, {key: ["default"] for key in plotters})
+        key_owners = defaultdict(
+            list, {key: ["default"] for key in defaultParams}
+        )
 
         def register_pm(ep, name):
             full_name = "%s:%s" % (ep.module, name)
@@ -875,12 +1100,17 @@ environment variable."""
             return ret
 
         for ep in self._load_plugin_entrypoints():
+            cache_key = _plugin_cache_key(ep)
             try:
-                plugin_mod = ep.load()
-            except (ModuleNotFoundError, ImportError):
-                logger.debug("Failed to import %s!" % (ep,), exc_info=True)
-                logger.warning("Failed to import %s!" % (ep,))
-                continue
+                plugin_mod = _plugin_cache[cache_key]
+            except KeyError:
+                try:
+                    plugin_mod = ep.load()
+                except (ModuleNotFoundError, ImportError):
+                    logger.debug("Failed to import %s!" % (ep,), exc_info=True)
+                    logger.warning("Failed to import %s!" % (ep,))
+                    continue
+                _plugin_cache[cache_key] = plugin_mod
             rc = plugin_mod.rcParams
 
             # load the plotters
@@ -889,7 +1119,9 @@ environment variable."""
                 for key, val in rc.get("project.plotters", {}).items()
                 if register_pm(ep, key)
             }
-            already_defined = set(plotters).intersection(plugin_plotters)
+            already_defined = [
+                key for key in plugin_plotters if key in plotters
+            ]
             if already_defined:
                 msg = (
                     "Error while loading psyplot plugin %s! The "
@@ -898,16 +1130,9 @@ environment variable."""
                 ) % ep
                 msg += "and will be overwritten:" if not raise_error else ":"
                 msg += "\n" + "\n".join(
-                    chain.from_iterable(
-                        (
-                            (
-                                "%s by %s" % (key, plugin)
-                                for plugin, keys in def_plots.items()
-                                if key in keys
-                            )
-                            for key in already_defined
-                        )
-                    )
+                    "%s by %s" % (key, plugin)
+                    for key in already_defined
+                    for plugin in plot_owners[key]
                 )
                 if raise_error:
                     raise ImportError(msg)
@@ -916,13 +1141,16 @@ environment variable."""
             for d in plugin_plotters.values():
                 d["plugin"] = ep.module
             plotters.update(plugin_plotters)
-            def_plots[ep] = list(plugin_plotters)
+            for key in plugin_plotters:
+                plot_owners[key].append(ep)
 
             # load the defaultParams keys
             plugin_defaultParams = rc.defaultParams
-            already_defined = set(defaultParams).intersection(
-                plugin_defaultParams
-            ) - {"project.plotters"}
+            already_defined = [
+                key
+                for key in plugin_defaultParams
+                if key in defaultParams and key != "project.plotters"
+            ]
             if already_defined:
                 msg = (
                     "Error while loading psyplot plugin %s! The "
@@ -930,29 +1158,23 @@ environment variable."""
                     "defined:"
                 ) % ep
                 msg += "\n" + "\n".join(
-                    chain.from_iterable(
-                        (
-                            (
-                                "%s by %s" % (key, plugin)
-                                for plugin, keys in def_keys.items()
-                                if key in keys
-                            )
-                            for key in already_defined
-                        )
-                    )
+                    "%s by %s" % (key, plugin)
+                    for key in already_defined
+                    for plugin in key_owners[key]
                 )
                 if raise_error:
                     raise ImportError(msg)
                 else:
                     warn(msg)
-            update_keys = set(plugin_defaultParams) - {"project.plotters"}
-            def_keys[ep] = update_keys
-            self.defaultParams.update(
+            update_keys = plugin_defaultParams.keys() - {"project.plotters"}
+            for key in update_keys:
+                key_owners[key].append(ep)
+            defaultParams.update(
                 {key: plugin_defaultParams[key] for key in update_keys}
             )
 
             # load the rcParams (without validation)
-            super(RcParams, self).update({key: rc[key] for key in update_keys})
+            dict.update(self, {key: rc[key] for key in update_keys})
 
             # add the deprecated keys
             self._deprecated_ignore_map.update(rc._deprecated_ignore_map)
@@ -960,6 +1182,7 @@ environment variable."""
 
     def copy(self):
         """Make sure, the right class is retained"""
+        self.ensure_loaded()
         return RcParams(self)
 
     @contextlib.contextmanager
@@ -974,9 +1197,19 @@ environment variable."""
                 assert rcParams['some_key'] == 1
             assert rcParams['some_key'] == 0
         """
-        save = dict(self)
-        yield
-        super().update(save)  # reset settings
+        self.ensure_loaded()
+        save = dict(dict.items(self))
+        try:
+            yield
+        finally:
+            # reset settings, including deleted and new keys
+            dict.clear(self)
+            dict.update(self, save)
+
+
+#: True if the configuration directory is in ``$HOME/.config`` (see
+#: :func:`get_configdir`)
+_use_dot_config = sys.platform.startswith("linux") or sys.platform == "darwin"
 
 
 def psyplot_fname(env_key="PSYPLOTRC", fname="psyplotrc.yml", if_exists=True):
@@ -1081,15 +1314,12 @@ def get_configdir(name="psyplot", env_key="PSYPLOTCONFIGDIR"):
 
     p = None
     h = _get_home()
-    if (
-        sys.platform.startswith("linux") or sys.platform == "darwin"
-    ) and h is not None:
+    if _use_dot_config and h is not None:
         p = os.path.join(h, ".config/" + name)
     elif h is not None:
         p = os.path.join(h, "." + name)
 
-    if not os.path.exists(p):
-        os.makedirs(p, exist_ok=True)
+    os.makedirs(p, exist_ok=True)
     return p
 
 
@@ -1105,7 +1335,17 @@ def validate_path_exists(s):
 
 def validate_files_exist(files):
     """Validate if all pathnames in a given list exists"""
-    return [validate_str(fn) and validate_path_exists(fn) for fn in files]
+    exists = os.path.exists
+    ret = []
+    for fn in files:
+        if not isinstance(fn, str):
+            raise ValueError("Did not found string!")
+        if fn and not exists(fn):
+            raise ValueError(
+                '"%s" should be a path but it does not exist' % fn
+            )
+        ret.append(fn)
+    return ret
 
 
 def validate_dict(d):
@@ -1123,20 +1363,32 @@ def validate_dict(d):
     Raises
     ------
     ValueError"""
-    try:
-        return dict(d)
-    except TypeError:
+    if isinstance(d, str):
         d = validate_path_exists(d)
         try:
             with open(d) as f:
-                return dict(yaml.load(f, Loader=yaml.SafeLoader))
+                return dict(yaml.load(f, Loader=_YamlLoader))
         except Exception:
             raise ValueError("Could not convert {} to dictionary!".format(d))
+    # always copy, the defaults must not be changed through the rcParams
+    try:
+        return dict(d)
+    except (TypeError, ValueError):
+        raise ValueError("Could not convert {} to dictionary!".format(d))
+
+
+#: Values that are accepted as True by :func:`validate_bool`
+_true_values = frozenset(["t", "y", "yes", "on", "true", "1", 1, True])
+
+#: Values that are accepted as False by :func:`validate_bool`
+_false_values = frozenset(["f", "n", "no", "off", "false", "0", 0, False])
 
 
 def validate_bool_maybe_none(b):
     "Convert b to a boolean or raise"
-    if isinstance(b, six.string_types):
+    if b is None or b is True or b is False:
+        return b
+    if isinstance(b, str):
         b = b.lower()
     if b is None or b == "none":
         return None
@@ -1145,14 +1397,18 @@ def validate_bool_maybe_none(b):
 
 def validate_bool(b):
     """Convert b to a boolean or raise"""
-    if isinstance(b, six.string_types):
+    if b is True or b is False:
+        return b
+    if isinstance(b, str):
         b = b.lower()
-    if b in ("t", "y", "yes", "on", "true", "1", 1, True):
-        return True
-    elif b in ("f", "n", "no", "off", "false", "0", 0, False):
-        return False
-    else:
-        raise ValueError('Could not convert "%s" to boolean' % b)
+    try:
+        if b in _true_values:
+            return True
+        elif b in _false_values:
+            return False
+    except TypeError:  # unhashable
+        pass
+    raise ValueError('Could not convert "%s" to boolean' % b)
 
 
 def validate_str(s):
@@ -1169,9 +1425,9 @@ def validate_str(s):
     Raises
     ------
     ValueError"""
-    if not isinstance(s, six.string_types):
+    if not isinstance(s, str):
         raise ValueError("Did not found string!")
-    return six.text_type(s)
+    return str(s)
 
 
 def validate_stringlist(s):
@@ -1189,13 +1445,17 @@ def validate_stringlist(s):
     Raises
     ------
     ValueError"""
-    if isinstance(s, six.string_types):
-        return [six.text_type(v.strip()) for v in s.split(",") if v.strip()]
+    if isinstance(s, str):
+        # intern the names, they are usually compared to dimension names
+        return [sys.intern(v.strip()) for v in s.split(",") if v.strip()]
+    elif isinstance(s, (list, tuple)) and all(type(v) is str for v in s):
+        # nothing to convert
+        return list(s)
     else:
         try:
             return list(map(validate_str, s))
         except TypeError as e:
-            raise ValueError(e.message)
+            raise ValueError(str(e))
 
 
 def validate_stringset(*args, **kwargs):
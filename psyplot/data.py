@@ -16,7 +16,7 @@ import os
 import os.path as osp
 import re
 from collections import defaultdict
-from functools import partial
+from functools import lru_cache, partial
 from glob import glob
 from importlib import import_module
 from itertools import chain, count, cycle, islice, product, repeat, starmap
@@ -109,7 +109,7 @@ def _infer_interval_breaks(coord):
 def _get_variable_names(arr):
     """Return the variable names of an array"""
     if VARIABLELABEL in arr.dims:
-        return arr.coords[VARIABLELABEL].tolist()
+        return arr.indexes[VARIABLELABEL].tolist()
     else:
         return arr.name
 
@@ -237,9 +237,13 @@ def to_slice(arr):
         return arr
     if len(arr) == 1:
         return slice(arr[0], arr[0] + 1)
-    step = np.unique(arr[1:] - arr[:-1])
-    if len(step) == 1:
-        return slice(arr[0], arr[-1] + step[0], step[0])
+    elif not len(arr):
+        return None
+    step = arr[1] - arr[0]
+    if step and (np.diff(arr) == step).all():
+        stop = arr[-1] + step
+        # a negative stop would count from the end
+        return slice(arr[0], stop if stop >= 0 else None, step)
 
 
 def get_index_from_coord(coord, base_index):
@@ -270,6 +274,11 @@ def get_index_from_coord(coord, base_index):
         return base_index.get_loc(values[()])
     if len(values) == len(base_index) and (values == base_index).all():
         return slice(None)
+    if base_index.is_unique:
+        indexer = base_index.get_indexer(values)
+        if not (indexer == -1).any():
+            return to_slice(indexer) or indexer
+    # missing values (raise a KeyError) or a non-unique index
     values = np.array(list(map(lambda i: base_index.get_loc(i), values)))
     return to_slice(values) or values
 
@@ -285,6 +294,15 @@ t_patterns = {
 }
 
 
+@lru_cache(maxsize=32)
+def _compile_t_pattern(t_format):
+    """Compile the regex for the datetime format string `t_format`"""
+    t_pattern = t_format
+    for fmt, patt in t_patterns.items():
+        t_pattern = t_pattern.replace(fmt, patt)
+    return re.compile(t_pattern)
+
+
 @docstrings.get_sections(base="get_tdata")
 @dedent
 def get_tdata(t_format, files):
@@ -312,34 +330,33 @@ def get_tdata(t_format, files):
     ----------
     .. [1] https://docs.python.org/2/library/datetime.html"""
 
-    def median(arr):
-        return arr.min() + (arr.max() - arr.min()) / 2
-
-    import re
-
     from pandas import Index
 
-    t_pattern = t_format
-    for fmt, patt in t_patterns.items():
-        t_pattern = t_pattern.replace(fmt, patt)
-    t_pattern = re.compile(t_pattern)
-    time = list(range(len(files)))
-    for i, f in enumerate(files):
-        time[i] = median(
-            np.array(
-                list(
-                    map(
-                        lambda s: np.datetime64(
-                            dt.datetime.strptime(s, t_format)
-                        ),
-                        t_pattern.findall(f),
-                    )
-                )
-            )
+    t_pattern = _compile_t_pattern(t_format)
+    matches = [t_pattern.findall(f) for f in files]
+    nmatches = np.array([len(m) for m in matches], dtype=int)
+    if len(files) and not nmatches.min():
+        raise ValueError(
+            "Could not find the time information in %s"
+            % (files[nmatches.argmin()],)
         )
+    # parse all dates at once and take the median of each file
+    dates = list(chain.from_iterable(matches))
+    try:
+        dates = to_datetime(dates, format=t_format).values
+    except ValueError:  # e.g. out of the bounds of pandas
+        dates = [dt.datetime.strptime(s, t_format) for s in dates]
+    dates = np.asarray(dates, dtype="datetime64[us]").view("i8")
+    if len(files):
+        starts = np.r_[0, nmatches[:-1].cumsum()]
+        tmin = np.minimum.reduceat(dates, starts)
+        tmax = np.maximum.reduceat(dates, starts)
+        time = (tmin + (tmax - tmin) // 2).view("datetime64[us]")
+    else:
+        time = dates.view("datetime64[us]")
     ind = np.argsort(time)  # sort according to time
     files = np.array(files)[ind]
-    time = np.array(time)[ind]
+    time = time[ind]
     return to_datetime(Index(time, name="time")), files
 
 
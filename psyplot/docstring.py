@@ -13,9 +13,7 @@ We use the docrep_ package for managing our docstrings
 # SPDX-License-Identifier: LGPL-3.0-only
 
 import inspect
-import types
 
-import six
 from docrep import DocstringProcessor, safe_modulo  # noqa: F401
 
 
@@ -27,8 +25,6 @@ def dedent(func):
     ----------
     func: function
         function with the documentation to dedent"""
-    if isinstance(func, types.MethodType) and not six.PY3:
-        func = func.im_func
     func.__doc__ = func.__doc__ and inspect.cleandoc(func.__doc__)
     return func
 
@@ -65,6 +65,13 @@ except ImportError as e:
     with_cdo = False
     cdo_version = None
 
+try:  # use the faster libyaml bindings, if available
+    from yaml import CLoader as _YamlLoader
+    from yaml import CSafeLoader as _YamlSafeLoader
+except ImportError:
+    from yaml import Loader as _YamlLoader
+    from yaml import SafeLoader as _YamlSafeLoader
+
 try:  # try import show_colormaps for convenience
     from psy_simple.colors import get_cmap, show_colormaps  # noqa: F401
 except ImportError:
@@ -82,6 +89,10 @@ _open_projects = []  # list of open projects
 _current_project = None  # current main project
 _current_subproject = None  # current subproject
 
+# the plotters of the plugins are registered below, so make sure that they are
+# loaded
+rcParams.ensure_loaded()
+
 # the informations on the psyplot and plugin versions
 _versions = get_versions(requirements=False)
 
@@ -497,9 +508,9 @@ class Project(ArrayList):
         else:
             path = Project._resolve_preset_path(preset)
             if path in rcParams["presets.trusted"]:
-                loader = yaml.Loader
+                loader = _YamlLoader
             else:
-                loader = yaml.SafeLoader
+                loader = _YamlSafeLoader
             with open(path) as f:
                 try:
                     config = yaml.load(f, loader)
@@ -614,7 +625,7 @@ class Project(ArrayList):
 
         if update:
             with open(fname) as f:
-                preset = yaml.load(f, yaml.Loader)
+                preset = yaml.load(f, _YamlLoader)
         else:
             preset = {}
         plotters = self.plotters
@@ -1370,7 +1381,7 @@ class Project(ArrayList):
                     ]
         if fname is not None:
             with open(fname, "wb") as f:
-                pickle.dump(ret, f)
+                pickle.dump(ret, f, protocol=pickle.HIGHEST_PROTOCOL)
             return None
 
         return ret
@@ -1558,7 +1569,6 @@ class Project(ArrayList):
         -------
         Project
             The project in state of the saving point"""
-        from pkg_resources import iter_entry_points
 
         def get_ax_base(name, alternatives):
             ax_base = next(iter(obj(arr_name=name).axes), None)
@@ -1572,13 +1582,13 @@ class Project(ArrayList):
         if isinstance(fname, six.string_types):
             with open(fname, "rb") as f:
                 pickle_kws = {} if not encoding else {"encoding": encoding}
-                d = pickle.load(f, **pickle_kws)
+                d = pickle.loads(f.read(), **pickle_kws)
             pwd = pwd or os.path.dirname(fname)
         else:
             d = dict(fname)
             pwd = pwd or os.getcwd()
         # check for patches of plugins
-        for ep in iter_entry_points("psyplot", name="patches"):
+        for ep in utils.plugin_entrypoints("psyplot", "patches"):
             patches = ep.load()
             for arr_d in d.get("arrays").values():
                 plotter_cls = arr_d.get("plotter", {}).get("cls")
@@ -11,10 +11,9 @@ import inspect
 import re
 import sys
 from difflib import get_close_matches
+from functools import lru_cache
 from itertools import chain, filterfalse
 
-import six
-
 from psyplot.docstring import dedent, docstrings
 
 
@@ -31,8 +30,17 @@ def isstring(s):
     return isinstance(s, str)
 
 
+@lru_cache(maxsize=None)
 def plugin_entrypoints(group="psyplot", name="name"):
-    """This utility function gets the entry points of the psyplot plugins"""
+    """This utility function gets the entry points of the psyplot plugins
+
+    The installed distributions are only scanned once per `group` and `name`.
+    Use ``plugin_entrypoints.cache_clear()`` to find newly installed plugins.
+
+    Returns
+    -------
+    tuple
+        The matching entry points"""
     if sys.version_info[:2] > (3, 7):
         from importlib.metadata import entry_points
 
@@ -46,7 +54,7 @@ def plugin_entrypoints(group="psyplot", name="name"):
         from pkg_resources import iter_entry_points
 
         eps = iter_entry_points(group=group, name=name)
-    return eps
+    return tuple(eps)
 
 
 class Defaultdict(dict):
@@ -132,15 +140,8 @@ class _TempBool(object):
         if not self._entered:
             self.value = self.default
 
-    if six.PY2:
-
-        def __nonzero__(self):
-            return self.value
-
-    else:
-
-        def __bool__(self):
-            return self.value
+    def __bool__(self):
+        return self.value
 
     def __repr__(self):
         return repr(bool(self))
@@ -218,7 +219,7 @@ def unique_everseen(iterable, key=None):
 
 def is_remote_url(path):
     patt = re.compile(r"^https?\://")
-    if not isinstance(path, six.string_types):
+    if not isinstance(path, str):
         return all(map(patt.search, (s or "" for s in path)))
     return bool(re.search(r"^https?\://", path))
 
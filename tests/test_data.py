@@ -7,6 +7,7 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-only
 
+import datetime as dt
 import os
 import os.path as osp
 import tempfile
@@ -1949,5 +1950,77 @@ class FilenamesTest(unittest.TestCase):
         self._test_engine("scipy")
 
 
+class IndexFromCoordTest(unittest.TestCase):
+    """Test the :func:`psyplot.data.get_index_from_coord` function"""
+
+    def test_get_index_from_coord(self):
+        base_index = pd.Index(np.arange(10) * 2.0)
+        get_index = psyd.get_index_from_coord
+        self.assertEqual(get_index(np.array(4.0), base_index), 2)
+        self.assertEqual(get_index(base_index.values, base_index), slice(None))
+        self.assertEqual(
+            get_index(np.array([2.0, 4.0, 6.0]), base_index), slice(1, 4, 1)
+        )
+        self.assertEqual(
+            get_index(np.array([2.0, 8.0, 6.0]), base_index).tolist(),
+            [1, 4, 3],
+        )
+        with self.assertRaises(KeyError):
+            get_index(np.array([1.0, 2.0]), base_index)
+        # decreasing indices
+        self.assertEqual(
+            get_index(np.array([4.0, 2.0, 0.0]), base_index),
+            slice(2, None, -1),
+        )
+        # non-unique index
+        base_index = pd.Index([0, 1, 1, 2])
+        self.assertEqual(
+            get_index(np.array([0, 2]), base_index), slice(0, 6, 3)
+        )
+
+
+class VariableNamesTest(unittest.TestCase):
+    """Test the :func:`psyplot.data._get_variable_names` function"""
+
+    def test_get_variable_names(self):
+        arr = xr.DataArray(
+            np.zeros((2, 3)),
+            dims=(psyd.VARIABLELABEL, "x"),
+            coords={psyd.VARIABLELABEL: ["t2m", "u"]},
+            name="test",
+        )
+        self.assertEqual(psyd._get_variable_names(arr), ["t2m", "u"])
+        self.assertEqual(psyd._get_variable_names(arr[0]), "test")
+
+
+class GetTdataTest(unittest.TestCase):
+    """Test the :func:`psyplot.data.get_tdata` function"""
+
+    def test_get_tdata(self):
+        files = [
+            "test_20000103-20000105.nc",
+            "test_20000101-20000101.nc",
+            "test_20000102-20000102.nc",
+        ]
+        time, sorted_files = psyd.get_tdata("%Y%m%d", files)
+        self.assertEqual(
+            list(time),
+            list(pd.to_datetime(["2000-01-01", "2000-01-02", "2000-01-04"])),
+        )
+        self.assertEqual(list(sorted_files), [files[1], files[2], files[0]])
+        with self.assertRaisesRegex(ValueError, "test.nc"):
+            psyd.get_tdata("%Y%m%d", ["test.nc"])
+
+    def test_get_tdata_out_of_bounds(self):
+        """Test dates that are outside the nanosecond range of pandas"""
+        files = ["test_25000101.nc", "test_10000101.nc"]
+        time, sorted_files = psyd.get_tdata("%Y%m%d", files)
+        self.assertEqual(
+            time.values.astype("datetime64[D]").tolist(),
+            [dt.date(1000, 1, 1), dt.date(2500, 1, 1)],
+        )
+        self.assertEqual(list(sorted_files), files[::-1])
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -77,6 +77,11 @@ class TestCommandLine(unittest.TestCase):
                 arg, parser.unfinished_arguments, msg="Missing " + arg
             )
 
+    def test_load_dims(self):
+        """Test the parsing of the ``-d`` arguments into mappings"""
+        self.assertEqual(main._load_dims("time,1,2"), {"time": [1, 2]})
+        self.assertEqual(main._load_dims("time"), {})
+
     def test_main_01_from_project(self):
         """Test the :func:`psyplot.__main__.main` function"""
         if not six.PY2:
@@ -121,6 +126,35 @@ class TestCommandLine(unittest.TestCase):
             {bt.get_file("circumpolar_test.nc")},
         )
 
+    def test_load_project_arrays(self):
+        """Test the loading of the file names without the full project"""
+        import pickle
+
+        sp, fname = self._create_and_save_test_project()
+        with open(fname, "rb") as f:
+            ref = pickle.load(f)["arrays"]
+        d = main._load_project_arrays(fname)
+        self.assertEqual(list(d), list(ref))
+        self.assertEqual(sp._get_dsnames(d), sp._get_dsnames(ref))
+
+        # numpy scalars are kept
+        import numpy as np
+
+        arrays = {
+            "arr0": {
+                "fname": np.str_("test.nc"),
+                "store": None,
+                "dims": {"time": np.int64(1)},
+            }
+        }
+        for protocol in [2, pickle.HIGHEST_PROTOCOL]:
+            with open(fname, "wb") as f:
+                pickle.dump({"arrays": arrays}, f, protocol)
+            d = main._load_project_arrays(fname)
+            self.assertIsInstance(d["arr0"]["fname"], np.str_)
+            self.assertEqual(sp._get_dsnames(d), {("test.nc", None)})
+            self.assertEqual(d["arr0"]["dims"], {"time": 1})
+
     def test_main_03_dims(self):
         import yaml
 
@@ -189,6 +223,19 @@ class TestCommandLine(unittest.TestCase):
                 msg="Wrong value for fmt2 of plotter %i!" % i,
             )
 
+    def test_version(self):
+        """Test to display the version"""
+        proc = spr.Popen(
+            [sys.executable, "-m", "psyplot", "-V"],
+            stdout=spr.PIPE,
+            stderr=spr.PIPE,
+        )
+        proc.wait()
+        self.assertFalse(proc.poll(), msg=proc.stderr.read())
+        self.assertEqual(
+            proc.stdout.read().decode("utf-8").strip(), psyplot.__version__
+        )
+
     def test_all_versions(self):
         """Test to display all versions"""
         ref = psyplot.get_versions()
@@ -209,6 +256,15 @@ class TestCommandLine(unittest.TestCase):
         )
         self.assertEqual(d, ref)
 
+    def test_versions_cache(self):
+        """Test that the cached versions are not changed by the caller"""
+        versions = psyplot.get_versions()
+        ref = versions["psyplot"]["requirements"]["numpy"]
+        versions["psyplot"]["requirements"]["numpy"] = "changed"
+        self.assertEqual(
+            psyplot.get_versions()["psyplot"]["requirements"]["numpy"], ref
+        )
+
     def test_list_plugins(self):
         """Test to display all versions"""
         ref = psyplot.rcParams._plugins
@@ -222,6 +278,29 @@ class TestCommandLine(unittest.TestCase):
         d = yaml.load(proc.stdout.read(), yaml.Loader)
         self.assertEqual(d, ref)
 
+    def test_concat_dim_default(self):
+        """Test the representation of the default concat_dim"""
+        param = inspect.signature(main.make_plot).parameters["concat_dim"]
+        self.assertIs(param.default, main._concat_dim_default)
+        self.assertEqual(repr(param.default), "'__infer_concat_dim__'")
+
+    def test_list_plugins_deferred(self):
+        """Test that listing the plugins does not load the rcParams"""
+        code = (
+            "import psyplot, psyplot.__main__ as main; "
+            "main._print_plugins(); "
+            "assert psyplot.rcParams._deferred_load"
+        )
+        proc = spr.Popen(
+            [sys.executable, "-c", code],
+            stdout=spr.PIPE,
+            stderr=spr.PIPE,
+        )
+        proc.wait()
+        self.assertFalse(proc.poll(), msg=proc.stderr.read())
+        d = yaml.load(proc.stdout.read(), yaml.Loader)
+        self.assertEqual(d, psyplot.rcParams._plugins)
+
     def test_list_plot_methods(self):
         """Test to display all versions"""
         proc = spr.Popen(
@@ -7,12 +7,24 @@
 #
 # SPDX-License-Identifier: LGPL-3.0-only
 
+import os
+import tempfile
+import threading
+import time
 import unittest
+import unittest.mock
 
 import six
 
 import psyplot
-from psyplot.config.rcsetup import RcParams, SubDict, rcParams
+from psyplot.config.rcsetup import (
+    RcParams,
+    SubDict,
+    defaultParams_orig,
+    psyplot_fname,
+    rcParams,
+    validate_dict,
+)
 
 
 class SubDictTest(unittest.TestCase):
@@ -36,6 +48,87 @@ class SubDictTest(unittest.TestCase):
             "test12", sub.values(), msg="Item test1.2 catched in %s" % (sub,)
         )
 
+    def test_multiple_base_str(self):
+        """Test the precedence of multiple base strings"""
+        d = {
+            "test.1": "test1",
+            "test.2": "test2",
+            "test1.1": "test11",
+            "test1.3": "test13",
+            "other.4": "other4",
+        }
+        sub = SubDict(
+            d, ["test.", "test1."], pattern_base=[r"test\.", r"test1\."]
+        )
+        self.assertIsNotNone(sub._get_combined_pattern()[0])
+        self.assertEqual(sub.data, {"1": "test1", "2": "test2", "3": "test13"})
+        sub.replace = False
+        self.assertEqual(set(sub), {"test.1", "test.2", "test1.1", "test1.3"})
+        # patterns with further groups, like the ones of the plotters
+        sub = SubDict(
+            d,
+            ["test.", "test1."],
+            pattern="(1|3)(?=$)",
+            pattern_base=[r"test\.", r"test1\."],
+        )
+        self.assertIsNotNone(sub._get_combined_pattern()[0])
+        self.assertEqual(sub.data, {"1": "test1", "3": "test13"})
+        # optional key groups that do not take part in the match
+        sub = SubDict(
+            {"test.1": 1, "test.": 2, "other.1": 3},
+            ["test.", "other."],
+            pattern="1",
+            pattern_base=[r"test\.%(key)s?", r"other\.%(key)s"],
+        )
+        self.assertIsNotNone(sub._get_combined_pattern()[0])
+        sub.replace = False
+        self.assertEqual(set(sub.iterkeys()), {"test.1", "test.", "other.1"})
+        # patterns with backreferences are not combined
+        sub = SubDict(
+            {"1.1": 1, "1.2": 2},
+            "",
+            pattern=r"\d",
+            pattern_base=r"%(key)s\.(?P=key)",
+        )
+        self.assertIsNone(sub._get_combined_pattern()[0])
+        self.assertEqual(list(sub.iterkeys()), ["1"])
+        # neither are conditional references to groups
+        sub = SubDict(
+            {"p.ab": 1, "q.ab": 2, "q.c": 3, "p.c": 4},
+            ["p.", "q."],
+            pattern=r"(a)?(?(2)b|c)",
+            pattern_base=[r"p\.", r"q\."],
+            replace=False,
+        )
+        self.assertIsNone(sub._get_combined_pattern()[0])
+        self.assertEqual(sorted(sub), ["p.ab", "p.c", "q.ab", "q.c"])
+
+    def test_group_references(self):
+        """Test the fallback for patterns that refer to groups"""
+        d = {"p.ab": 1, "q.ab": 2, "q.c": 3, "p.c": 4, "p.aa": 5, "q.bb": 6}
+        for pattern in [r"(a)?(?(2)b|c)", r"(a)?(?(1)b|c)", r"(\w)\2"]:
+            sub = SubDict(
+                d,
+                ["p.", "q."],
+                pattern=pattern,
+                pattern_base=[r"p\.", r"q\."],
+                replace=False,
+            )
+            self.assertIsNone(sub._get_combined_pattern()[0], msg=pattern)
+            expected = sorted(
+                key
+                for key in d
+                if any(patt.match(key) for patt in sub.patterns)
+            )
+            with unittest.mock.patch.object(
+                SubDict,
+                "_match_patterns",
+                autospec=True,
+                side_effect=SubDict._match_patterns,
+            ) as match_patterns:
+                self.assertEqual(sorted(sub.iterkeys()), expected, msg=pattern)
+            self.assertEqual(match_patterns.call_count, len(d), msg=pattern)
+
     def test_replace(self):
         """Test the replace property"""
         d = {
@@ -59,6 +152,14 @@ class SubDictTest(unittest.TestCase):
         self.assertNotIn("test.1", sub)
         self.assertIn("1", sub)
 
+        # keys that are set in the SubDict itself are renamed, too
+        sub = SubDict(d, "test.", pattern_base=r"test\.")
+        sub["1"] = "not in d"
+        sub.replace = False
+        self.assertEqual(sub["test.1"], "not in d")
+        sub.replace = True
+        self.assertEqual(sub["1"], "not in d")
+
     def test_trace(self):
         """Test the backtracing to the origin dictionary"""
         d = {
@@ -125,6 +226,23 @@ class RcParamsTest(unittest.TestCase):
             rc["some.test"] = 2
             self.assertEqual(rc["some.test"], 2)
         self.assertEqual(rc["some.test"], 1)
+        # nested contexts
+        with rc.catch():
+            rc["some.test"] = 2
+            with rc.catch():
+                rc.update({"some.test": 3, "some.other_test": 4})
+                self.assertEqual(rc["some.other_test"], 4)
+            self.assertEqual(rc["some.test"], 2)
+            self.assertEqual(rc["some.other_test"], 2)
+            rc["some.other_test"] = 5
+        self.assertEqual(rc["some.test"], 1)
+        self.assertEqual(rc["some.other_test"], 2)
+        # deleted keys and raw writes
+        with rc.catch():
+            del rc["some.test"]
+            dict.__setitem__(rc, "some.other_test", 6)
+        self.assertEqual(rc["some.test"], 1)
+        self.assertEqual(rc["some.other_test"], 2)
 
     @unittest.skipIf(six.PY2, "Method not available on Python2")
     def test_error(self):
@@ -204,6 +322,155 @@ class RcParamsTest(unittest.TestCase):
         finally:
             test_rc["project.plotters"] = plotters
 
+    def test_defer_loading(self):
+        """Test whether the plugins are loaded on the first access"""
+        try:
+            import psyplot_test.plugin  # noqa: F401
+        except ImportError:
+            self.skipTest("Could not import the psyplot_test package")
+            return
+        rc = RcParams(defaultParams=defaultParams_orig.copy())
+        rc.update_from_defaultParams()
+        rc.defer_loading()
+        self.assertNotIn("test", dict.keys(rc))
+        self.assertIn("test", rc)
+        self.assertEqual(rc["test"], 1)
+        self.assertIn("test_plotter", rc["project.plotters"])
+
+    def test_defer_loading_deprecated(self):
+        """Test the deprecated keys, the retry and len of deferred loading"""
+        rc = RcParams(
+            defaultParams={
+                "some.test": [1, lambda i: int(i), "The documentation"],
+            }
+        )
+        rc.update_from_defaultParams()
+        calls = []
+
+        def load(*args, **kwargs):
+            calls.append(1)
+            if len(calls) == 1:
+                raise ImportError("Expected failure")
+            rc._deprecated_map["old.test"] = ["some.test", lambda x: x]
+            dict.__setitem__(rc, "other.test", 2)
+
+        rc.load = load
+        rc.defer_loading()
+        with self.assertRaisesRegex(ImportError, "Expected failure"):
+            rc["some.test"]
+        # the loading is retried on the next access
+        with self.assertWarnsRegex(UserWarning, "old.test is deprecated"):
+            self.assertEqual(rc["old.test"], 1)
+        self.assertEqual(len(calls), 2)
+
+        rc.defer_loading()
+        self.assertEqual(len(rc), 2)
+        self.assertEqual(len(calls), 3)
+
+        # the mutating methods of dict load the instance, too
+        for method, args in [
+            ("pop", ("other.test",)),
+            ("setdefault", ("other.test", 3)),
+            ("__delitem__", ("other.test",)),
+            ("popitem", ()),
+        ]:
+            rc.defer_loading()
+            getattr(rc, method)(*args)
+            self.assertFalse(rc._deferred_load, msg=method)
+        self.assertEqual(len(calls), 7)
+
+    def test_defer_loading_threads(self):
+        """Test that the deferred loading only runs once with threads"""
+        rc = RcParams(
+            defaultParams={
+                "some.test": [1, lambda i: int(i), "The documentation"],
+            }
+        )
+        rc.update_from_defaultParams()
+        calls = []
+        started = threading.Event()
+
+        def load(*args, **kwargs):
+            calls.append(1)
+            started.set()
+            time.sleep(0.1)
+            dict.__setitem__(rc, "other.test", 2)
+
+        rc.load = load
+        rc.defer_loading()
+        results = []
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(rc.get("other.test"))
+            )
+            for i in range(2)
+        ]
+        threads[0].start()
+        started.wait()
+        threads[1].start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(results, [2, 2])
+        self.assertEqual(len(calls), 1)
+
+    def test_plugin_cache(self):
+        """Test whether the plugin modules are only loaded once"""
+        from psyplot.config import rcsetup
+
+        try:
+            import psyplot_test.plugin  # noqa: F401
+        except ImportError:
+            self.skipTest("Could not import the psyplot_test package")
+            return
+        RcParams._clear_plugin_cache()
+        rc = RcParams(defaultParams=defaultParams_orig.copy())
+        rc.update_from_defaultParams()
+        rc.load_plugins()
+        self.assertTrue(rcsetup._plugin_cache)
+        rc = RcParams(defaultParams=defaultParams_orig.copy())
+        rc.update_from_defaultParams()
+        with unittest.mock.patch(
+            "importlib.metadata.EntryPoint.load",
+            side_effect=AssertionError("Plugin loaded twice"),
+        ):
+            rc.load_plugins()
+        self.assertEqual(rc["test"], 1)
+        RcParams._clear_plugin_cache()
+        self.assertFalse(rcsetup._plugin_cache)
+
+    def test_load_from_file(self):
+        """Test the loading (and reloading) of a configuration file"""
+        rc = RcParams(
+            defaultParams={
+                "some.test": [1, lambda i: int(i), "The documentation"],
+            }
+        )
+        rc.update_from_defaultParams()
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fname = os.path.join(tmpdir, "psyplotrc.yml")
+            with open(fname, "w") as f:
+                f.write("some.test: 2\n")
+            rc.load_from_file(fname)
+            self.assertEqual(rc["some.test"], 2)
+            # the file changed and has to be parsed again
+            with open(fname, "w") as f:
+                f.write("some.test: 30\n")
+            rc.load_from_file(fname)
+            self.assertEqual(rc["some.test"], 30)
+
+    def test_psyplot_fname(self):
+        """Test the lookup of the configuration file"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fname = os.path.join(tmpdir, "psyplotrc.yml")
+            env = {"PSYPLOTRC": tmpdir, "PSYPLOTCONFIGDIR": tmpdir}
+            with unittest.mock.patch.dict(os.environ, env):
+                self.assertIsNone(psyplot_fname())
+                self.assertEqual(psyplot_fname(if_exists=False), fname)
+                # the new file has to be found right away
+                with open(fname, "w") as f:
+                    f.write("some.test: 2\n")
+                self.assertEqual(psyplot_fname(), fname)
+
     def test_connect(self):
         """Test the connection and disconnection to rcParams"""
         x = set()
@@ -234,5 +501,24 @@ class RcParamsTest(unittest.TestCase):
         self.assertEqual(y, {"test2"})
 
 
+class ValidatorsTest(unittest.TestCase):
+    """Test the validation functions of the rcParams"""
+
+    def test_validate_dict(self):
+        """Test the validation of dictionaries and yaml files"""
+        d = {"a": 1}
+        self.assertEqual(validate_dict(d), d)
+        self.assertIsNot(validate_dict(d), d)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            fname = os.path.join(tmpdir, "test.yml")
+            with open(fname, "w") as f:
+                f.write("a: 2\n")
+            self.assertEqual(validate_dict(fname), {"a": 2})
+        with self.assertRaisesRegex(ValueError, "does not exist"):
+            validate_dict("ab")
+        with self.assertRaisesRegex(ValueError, "Could not convert"):
+            validate_dict(5)
+
+
 if __name__ == "__main__":
     unittest.main()